@@ -9,9 +9,11 @@ Requires slack-bolt: pip install slack-bolt
 """
 
 import argparse
-import json
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -25,14 +27,36 @@ from meeting_sync import (
     sync_meetings,
     find_todays_meetings,
     extract_action_items_from_file,
+    load_action_items_cache,
+    save_action_items_cache,
     DEFAULT_CONFIG_PATH,
 )
 
+# ── Patterns ──────────────────────────────────────────────────────────────
+
+# Items mentioning Katie by name are hers
+_KATIE_RE = re.compile(r"\bkatie\b", re.IGNORECASE)
+
+# Matches done_checkbox_0, done_checkbox_1, etc.
+_CHECKBOX_ACTION_RE = re.compile(r"^done_checkbox_\d+$")
+
+
 # ── Globals set at startup ────────────────────────────────────────────────
 
 cfg = None
 app = None
 
+# Short-lived cache of today's items so bursts of mentions/DMs (and Slack
+# retries) don't each trigger a re-parse
+ITEMS_CACHE_TTL = 10  # seconds
+_items_cache = None
+_items_cache_ts = 0.0
+_items_lock = threading.Lock()
+
+# Set while a background Granola sync is running
+_sync_in_flight = threading.Event()
+_sync_start_lock = threading.Lock()
+
 
 # ── Block Kit builders ────────────────────────────────────────────────────
 
@@ -49,7 +73,8 @@ def split_katie_items(action_items_by_meeting):
         katie = []
         other = []
         for item in meeting["items"]:
-            if item.startswith("(me)") or re.search(r'\bkatie\b', item, re.IGNORECASE):
+            # Cheap substring test first; the regex only enforces word boundaries
+            if item.startswith("(me)") or ("katie" in item.lower() and _KATIE_RE.search(item)):
                 katie.append(item)
             else:
                 other.append(item)
@@ -61,7 +86,39 @@ def split_katie_items(action_items_by_meeting):
     return katie_items, other_meetings
 
 
-def build_interactive_blocks(action_items_by_meeting):
+def append_meeting_blocks(blocks, m_idx, meeting):
+    """Append the title, checkboxes and divider blocks for one meeting."""
+    # Meeting title
+    blocks.append({
+        "type": "section",
+        "block_id": f"mt_{m_idx}",
+        "text": {"type": "mrkdwn", "text": f"*{meeting['title']}*"},
+    })
+
+    # Checkboxes for action items
+    options = [
+        {
+            "text": {"type": "mrkdwn", "text": item},
+            "value": f"{m_idx}:{i_idx}",
+        }
+        for i_idx, item in enumerate(meeting["items"])
+    ]
+
+    if options:
+        blocks.append({
+            "type": "actions",
+            "block_id": f"ma_{m_idx}",
+            "elements": [{
+                "type": "checkboxes",
+                "action_id": f"done_checkbox_{m_idx}",
+                "options": options,
+            }],
+        })
+
+    blocks.append({"type": "divider"})
+
+
+def build_interactive_blocks(action_items_by_meeting, today_str):
     """Build Block Kit with checkboxes, Katie's items shown first."""
     katie_items, other_meetings = split_katie_items(action_items_by_meeting)
 
@@ -70,21 +127,22 @@ def build_interactive_blocks(action_items_by_meeting):
             "type": "header",
             "text": {
                 "type": "plain_text",
-                "text": f"Action Items \u2014 {datetime.now().strftime('%B %d, %Y')}",
+                "text": f"Action Items \u2014 {today_str}",
             },
         },
         {"type": "divider"},
     ]
 
-    # Combine: Katie's items first, then others
-    all_meetings = []
+    # Katie's items first, then others; meeting indices run across both
+    m_idx = 0
     if katie_items:
         blocks.append({
             "type": "section",
             "text": {"type": "mrkdwn", "text": "*Your action items:*"},
         })
-        for m in katie_items:
-            all_meetings.append(m)
+        for meeting in katie_items:
+            append_meeting_blocks(blocks, m_idx, meeting)
+            m_idx += 1
     if other_meetings:
         if katie_items:
             blocks.append({"type": "divider"})
@@ -92,62 +150,34 @@ def build_interactive_blocks(action_items_by_meeting):
                 "type": "section",
                 "text": {"type": "mrkdwn", "text": "*Other action items:*"},
             })
-        for m in other_meetings:
-            all_meetings.append(m)
-
-    for m_idx, meeting in enumerate(all_meetings):
-        # Meeting title
-        blocks.append({
-            "type": "section",
-            "block_id": f"meeting_title_{m_idx}",
-            "text": {"type": "mrkdwn", "text": f"*{meeting['title']}*"},
-        })
-
-        # Checkboxes for action items
-        options = []
-        for i_idx, item in enumerate(meeting["items"]):
-            options.append({
-                "text": {"type": "mrkdwn", "text": item},
-                "value": json.dumps({"m": m_idx, "i": i_idx, "text": item}),
-            })
-
-        if options:
-            blocks.append({
-                "type": "actions",
-                "block_id": f"meeting_actions_{m_idx}",
-                "elements": [{
-                    "type": "checkboxes",
-                    "action_id": f"done_checkbox_{m_idx}",
-                    "options": options,
-                }],
-            })
-
-        blocks.append({"type": "divider"})
+        for meeting in other_meetings:
+            append_meeting_blocks(blocks, m_idx, meeting)
+            m_idx += 1
 
     return blocks
 
 
-def build_all_done_blocks():
+def build_all_done_blocks(today_str):
     """Blocks shown when every item is completed."""
     return [
         {
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"*All action items completed* \u2014 {datetime.now().strftime('%B %d, %Y')} :white_check_mark:",
+                "text": f"*All action items completed* \u2014 {today_str} :white_check_mark:",
             },
         },
     ]
 
 
-def build_no_items_blocks():
+def build_no_items_blocks(today_str):
     """Blocks shown when there are no action items today."""
     return [
         {
             "type": "section",
             "text": {
                 "type": "mrkdwn",
-                "text": f"No action items from meetings today ({datetime.now().strftime('%B %d, %Y')}).",
+                "text": f"No action items from meetings today ({today_str}).",
             },
         },
     ]
@@ -155,136 +185,204 @@ def build_no_items_blocks():
 
 # ── Helpers ───────────────────────────────────────────────────────────────
 
+def start_background_sync():
+    """Kick off a Granola sync on a daemon thread unless one is already running.
+
+    Syncing can take longer than Slack's 3s ack window, so event handlers
+    don't wait for it: they serve what's on disk now, and if the sync writes
+    any of today's meetings the items cache is dropped so the next event
+    sees them.
+    """
+    with _sync_start_lock:
+        if _sync_in_flight.is_set():
+            return
+        _sync_in_flight.set()
+    threading.Thread(target=_run_background_sync, daemon=True).start()
+
+
+def _run_background_sync():
+    """Thread body for start_background_sync."""
+    global _items_cache
+    written = None
+    try:
+        written = sync_meetings(cfg)
+    finally:
+        # sync_meetings returns the files written for today, the only ones
+        # that change today's items; None means it failed partway through
+        if written is None or written:
+            with _items_lock:
+                _items_cache = None
+        _sync_in_flight.clear()
+
+
+def _items_cache_fresh():
+    """True while the cached items are younger than ITEMS_CACHE_TTL."""
+    return (_items_cache is not None
+            and time.monotonic() - _items_cache_ts < ITEMS_CACHE_TTL)
+
+
 def get_todays_items():
-    """Sync new meetings from Granola, then extract today's action items."""
-    # Run sync first to pull any new meetings from Granola cache
-    synced_files = sync_meetings(cfg)
+    """Extract action items from today's meeting files.
+
+    Results are reused for ITEMS_CACHE_TTL seconds. Bolt dispatches handlers
+    on worker threads, so the lock also coalesces concurrent events onto a
+    single parse.
+    """
+    global _items_cache, _items_cache_ts
+
+    with _items_lock:
+        if _items_cache_fresh():
+            return _items_cache
+
+        _items_cache = _load_todays_items()
+        _items_cache_ts = time.monotonic()
+        return _items_cache
 
-    # Then find ALL of today's files (synced now + previously synced)
+
+def _load_todays_items():
+    """Uncached body of get_todays_items."""
+    # Find ALL of today's files (synced by the bot or the daily job)
     today_files = find_todays_meetings(cfg)
+
+    # Reads are I/O-bound, so overlap them; results keep file order
+    cache = load_action_items_cache(cfg)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = [ex.submit(extract_action_items_from_file, p, cache) for p in today_files]
+
     results = []
-    for file_path in today_files:
-        if not file_path.exists():
+    for future in futures:
+        try:
+            title, items = future.result()
+        except FileNotFoundError:
+            # Removed between listing and reading
             continue
-        title, items = extract_action_items_from_file(file_path)
         if items:
             results.append({"title": title, "items": items})
+
+    save_action_items_cache(cfg, cache)
     return results
 
 
 def send_action_items(say):
     """Extract and send today's action items as an interactive message."""
+    today_str = datetime.now().strftime('%B %d, %Y')
+    # Pull any new meetings from the Granola cache without blocking the reply.
+    # Skip it while the items cache is fresh: the event that filled it started
+    # a sync moments ago, and bursts or Slack retries needn't each start one.
+    if not _items_cache_fresh():
+        start_background_sync()
     items = get_todays_items()
     if not items:
-        say(blocks=build_no_items_blocks(), text="No action items today.")
+        say(blocks=build_no_items_blocks(today_str), text="No action items today.")
         return
 
     total = sum(len(m["items"]) for m in items)
-    blocks = build_interactive_blocks(items)
+    blocks = build_interactive_blocks(items, today_str)
     say(blocks=blocks, text=f"{total} action item(s) from {len(items)} meeting(s)")
 
 
-def rebuild_blocks_after_check(existing_blocks, checked_values):
-    """Rebuild message blocks with checked items removed."""
-    checked_texts = set()
-    for val in checked_values:
-        try:
-            parsed = json.loads(val)
-            checked_texts.add(parsed["text"])
-        except (json.JSONDecodeError, KeyError):
-            checked_texts.add(val)
+def option_key(value):
+    """Parse a checkbox option value ("<meeting>:<item>") into an index pair.
 
-    new_blocks = []
-    any_items_remaining = False
+    Values that don't parse (e.g. from messages posted by older versions)
+    are returned unchanged so they can still be matched verbatim.
+    """
+    m_idx, _, i_idx = value.partition(":")
+    try:
+        return int(m_idx), int(i_idx)
+    except ValueError:
+        return value
+
+
+def _is_title_block(block):
+    """True for a meeting title block, including ones in messages posted
+    before the short block ids (block_id "meeting_title_<index>")."""
+    block_id = block.get("block_id") or ""
+    return block_id[:3] == "mt_" or block_id.startswith("meeting_title_")
 
-    i = 0
-    while i < len(existing_blocks):
-        block = existing_blocks[i]
 
-        # Keep header and top divider as-is
-        if block.get("type") in ("header",):
+def pair_meeting_blocks(blocks):
+    """Group message blocks into (block, actions_block) pairs in one scan.
+
+    A meeting title block (see _is_title_block) is paired with the actions
+    block that follows it, if any; every other block is paired with None.
+    Dividers are dropped since the rebuilt message adds its own.
+    """
+    pairs = []
+    for block in blocks:
+        btype = block.get("type")
+        if btype == "divider":
+            continue
+        if (btype == "actions" and pairs and pairs[-1][1] is None
+                and _is_title_block(pairs[-1][0])):
+            pairs[-1] = (pairs[-1][0], block)
+            continue
+        pairs.append((block, None))
+    return pairs
+
+
+def rebuild_blocks_after_check(existing_blocks, checked_values, today_str):
+    """Rebuild message blocks with checked items removed.
+
+    Returns (new_blocks, total_remaining), where total_remaining is the
+    number of unchecked items left across all meetings.
+    """
+    checked_keys = {option_key(val) for val in checked_values}
+
+    new_blocks = []
+    total_remaining = 0
+
+    for block, actions_block in pair_meeting_blocks(existing_blocks):
+        # Keep header, section labels and anything else as-is
+        if not _is_title_block(block):
             new_blocks.append(block)
-            i += 1
             continue
 
-        # Meeting title block
-        if block.get("type") == "section" and (block.get("block_id") or "").startswith("meeting_title_"):
-            title_block = block
-            title_text = block["text"]["text"]
-
-            # Look ahead for the actions block
-            actions_block = None
-            if i + 1 < len(existing_blocks) and existing_blocks[i + 1].get("type") == "actions":
-                actions_block = existing_blocks[i + 1]
-
-            if actions_block:
-                # Filter out checked items
-                element = actions_block["elements"][0]
-                remaining_options = []
-                for opt in element.get("options", []):
-                    try:
-                        parsed = json.loads(opt["value"])
-                        if parsed["text"] not in checked_texts:
-                            remaining_options.append(opt)
-                    except (json.JSONDecodeError, KeyError):
-                        if opt["value"] not in checked_texts:
-                            remaining_options.append(opt)
-
-                # Also remove any that were in initial_options (already checked)
-                for opt in element.get("initial_options", []):
-                    try:
-                        parsed = json.loads(opt["value"])
-                        checked_texts.add(parsed["text"])
-                    except (json.JSONDecodeError, KeyError):
-                        pass
-                remaining_options = [
-                    o for o in remaining_options
-                    if json.loads(o["value"])["text"] not in checked_texts
-                ]
-
-                if remaining_options:
-                    any_items_remaining = True
-                    new_blocks.append({"type": "divider"})
-                    new_blocks.append(title_block)
-                    new_actions = dict(actions_block)
-                    new_actions["elements"] = [{
-                        "type": "checkboxes",
-                        "action_id": element["action_id"],
-                        "options": remaining_options,
-                    }]
-                    new_blocks.append(new_actions)
-                else:
-                    # All items done for this meeting
-                    new_blocks.append({"type": "divider"})
-                    clean_title = title_text.strip("*")
-                    new_blocks.append({
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": f"~{clean_title}~ \u2014 all done :white_check_mark:"},
-                    })
-
-                # Skip past title + actions + divider
-                i += 3 if (i + 2 < len(existing_blocks) and existing_blocks[i + 2].get("type") == "divider") else 2
-                continue
-            else:
-                # Title with no actions block — keep as-is
-                new_blocks.append({"type": "divider"})
-                new_blocks.append(title_block)
-                i += 1
-                continue
-
-        # Skip standalone dividers (we add our own)
-        if block.get("type") == "divider":
-            i += 1
+        new_blocks.append({"type": "divider"})
+
+        if actions_block is None:
+            # Title with no actions block — keep as-is
+            new_blocks.append(block)
             continue
 
-        # Keep anything else
-        new_blocks.append(block)
-        i += 1
+        # Filter out checked items
+        element = actions_block["elements"][0]
+
+        # Also remove any that were in initial_options (already checked).
+        # Slack only sends these for pre-checked items, so usually absent.
+        if element.get("initial_options"):
+            for opt in element["initial_options"]:
+                checked_keys.add(option_key(opt["value"]))
+
+        remaining_options = [
+            o for o in element.get("options", [])
+            if option_key(o["value"]) not in checked_keys
+        ]
+
+        if remaining_options:
+            total_remaining += len(remaining_options)
+            new_blocks.append(block)
+            new_blocks.append({
+                "type": "actions",
+                "block_id": actions_block.get("block_id"),
+                "elements": [{
+                    "type": "checkboxes",
+                    "action_id": element["action_id"],
+                    "options": remaining_options,
+                }],
+            })
+        else:
+            # All items done for this meeting
+            clean_title = block["text"]["text"].strip("*")
+            new_blocks.append({
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"~{clean_title}~ \u2014 all done :white_check_mark:"},
+            })
 
-    if not any_items_remaining:
-        return build_all_done_blocks()
+    if not total_remaining:
+        return build_all_done_blocks(today_str), 0
 
-    return new_blocks
+    return new_blocks, total_remaining
 
 
 # ── Event handlers ────────────────────────────────────────────────────────
@@ -306,31 +404,24 @@ def setup_handlers(app):
             send_action_items(say)
 
     # Register a handler for each possible checkbox action_id pattern
-    # We use a regex pattern to match done_checkbox_0, done_checkbox_1, etc.
-    import re
-
-    @app.action(re.compile(r"^done_checkbox_\d+$"))
+    @app.action(_CHECKBOX_ACTION_RE)
     def handle_checkbox(ack, body, client):
         """Handle checkbox interactions — remove checked items from message."""
         ack()
 
+        today_str = datetime.now().strftime('%B %d, %Y')
         channel = body["channel"]["id"]
         message_ts = body["message"]["ts"]
         existing_blocks = body["message"].get("blocks", [])
 
         # Collect ALL checked values across all checkbox groups in this message
-        checked_values = set()
-        for action in body.get("actions", []):
-            for opt in action.get("selected_options", []):
-                checked_values.add(opt["value"])
-
-        new_blocks = rebuild_blocks_after_check(existing_blocks, checked_values)
-
-        total_remaining = 0
-        for block in new_blocks:
-            if block.get("type") == "actions":
-                for el in block.get("elements", []):
-                    total_remaining += len(el.get("options", []))
+        checked_values = {
+            opt["value"]
+            for action in body.get("actions", ())
+            for opt in action.get("selected_options", ())
+        }
+
+        new_blocks, total_remaining = rebuild_blocks_after_check(existing_blocks, checked_values, today_str)
 
         client.chat_update(
             channel=channel,
@@ -21,6 +21,9 @@ if [ ! -d "$VENV_DIR" ]; then
 fi
 echo "Installing dependencies..."
 "$VENV_DIR/bin/pip" install -q slack-bolt
+# Optional speedups; the scripts fall back to the standard library without them
+"$VENV_DIR/bin/pip" install -q google-re2 orjson selectolax pyahocorasick \
+    || echo "  Optional speedups not installed; using stdlib fallbacks"
 PYTHON="$VENV_DIR/bin/python3"
 echo "  Using: $PYTHON"
 
@@ -9,15 +9,44 @@ Override with --config <path>.
 """
 
 import argparse
+import http.client
 import json
+import os
+import pickle
 import re
 import sys
-import urllib.request
-import urllib.error
+import tempfile
 import html as html_mod
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+try:
+    # Optional: RE2 matches in linear time, which helps on long transcripts
+    import re2 as _scan_re
+except ImportError:
+    _scan_re = re
+
+try:
+    # Optional: much faster on the large, deeply nested Granola cache
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    # Optional: C-backed HTML parser, one DOM walk instead of a regex cascade
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # Optional: matches every classification keyword in a single sweep
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
 # ── Action-item extraction (not user-configurable) ────────────────────────
 
 ACTION_SECTION_PATTERNS = [
@@ -49,7 +78,8 @@ TRANSCRIPT_ACTION_PATTERNS = [
     r"\bnext step[s]?\s+(?:is|are|on|here|for)\b",
     r"\bfollow[- ]?up (?:with|on)\b",
 ]
-TRANSCRIPT_ACTION_RE = re.compile("|".join(TRANSCRIPT_ACTION_PATTERNS), re.IGNORECASE)
+# Inline (?i) rather than re.IGNORECASE so the same source compiles under RE2
+TRANSCRIPT_ACTION_RE = _scan_re.compile("(?i)" + "|".join(TRANSCRIPT_ACTION_PATTERNS))
 
 # Short filler and non-actionable speech to ignore
 FILLER_PATTERNS = re.compile(
@@ -57,17 +87,64 @@ FILLER_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 # Lines that match action patterns but aren't real action items
-NOISE_PATTERNS = re.compile(
+NOISE_SOURCE = (
     r"\bi need to (?:run|go|hop|jump|leave|mute|drop)\b"
     r"|\blet me (?:see|show|think|check|look|pull up|share my screen)\b"
-    r"|\bi'(?:ll|m going to|m gonna) (?:be |try |just )",
-    re.IGNORECASE,
+    r"|\bi'(?:ll|m going to|m gonna) (?:be |try |just )"
 )
+NOISE_PATTERNS = _scan_re.compile("(?i)" + NOISE_SOURCE)
+
+# Action and noise patterns in one regex, so each line is scanned once.
+# Noise comes first so it wins when both match at the same position.
+ACTION_OR_NOISE_RE = _scan_re.compile(
+    f"(?i)(?P<noise>{NOISE_SOURCE})|(?P<action>{'|'.join(TRANSCRIPT_ACTION_PATTERNS)})"
+)
+
+# Transcript lines as written by write_meeting_file: [timestamp] (speaker) text
+TRANSCRIPT_LINE_RE = re.compile(r'^\[(?P<ts>[^\]]+)\]\s*\((?P<speaker>\w+)\)\s*(?P<text>.+)$', re.MULTILINE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Frontmatter title line, quoted or not
+TITLE_LINE_RE = re.compile(r'title:\s*"?([^"\n]*)"?')
+
+
+# ── JSON / File Helpers ───────────────────────────────────────────────────
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when installed."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when installed."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _write_atomic(path, data):
+    """Write bytes to path through a unique temp file, so concurrent writers
+    never share a temp file and readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 # ── Configuration ─────────────────────────────────────────────────────────
 
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "meeting-sync" / "config.json"
+CACHE_DIR = Path.home() / ".cache" / "meeting-sync"
 
 
 def load_config(config_path):
@@ -86,58 +163,121 @@ def load_config(config_path):
     cfg["_meetings_dir"] = cfg["_vault"] / cfg.get("meetings_subfolder", "Meetings")
     cfg["_granola_cache"] = Path(cfg["granola_cache"]).expanduser()
     cfg["_sync_state"] = cfg["_vault"] / ".meeting-sync" / "sync-state.json"
+    cfg["_granola_pickle"] = CACHE_DIR / "granola.pkl"
+    cfg["_action_items_cache"] = CACHE_DIR / "action-items.json"
+    cfg["_classifier"] = build_classifier(cfg)
 
     return cfg
 
 
 # ── HTML / ProseMirror Conversion ─────────────────────────────────────────
 
+# Compiled once; html_to_md runs for every summary panel of every meeting
+_RE_H = re.compile(r'<h([1-4])[^>]*>(.*?)</h\1>', re.DOTALL)
+_RE_STRONG = re.compile(r'<strong>(.*?)</strong>', re.DOTALL)
+_RE_B = re.compile(r'<b>(.*?)</b>', re.DOTALL)
+_RE_EM = re.compile(r'<em>(.*?)</em>', re.DOTALL)
+_RE_I = re.compile(r'<i>(.*?)</i>', re.DOTALL)
+_RE_A = re.compile(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', re.DOTALL)
+_RE_LI = re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL)
+_RE_LIST_BR = re.compile(r'</?[uo]l[^>]*>|<br\s*/?>')
+_RE_P = re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL)
+_RE_TAG = re.compile(r'<[^>]+>')
+_RE_NL = re.compile(r'\n{3,}')
+
+
+def _heading_to_md(m):
+    """Render an <hN> match as a markdown heading."""
+    return '#' * int(m.group(1)) + ' ' + m.group(2) + '\n'
+
+
+# Tag → markdown mapping for the selectolax path
+_HTML_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4}
+_HTML_EMPHASIS = {"strong": "**", "b": "**", "em": "*", "i": "*"}
+
+
+def _html_node_to_md(node, out):
+    """Append markdown for node's children to out (selectolax DOM walk)."""
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == "-text":
+            out.append(child.text(deep=False))
+        elif tag in _HTML_HEADINGS:
+            out.append("#" * _HTML_HEADINGS[tag] + " ")
+            _html_node_to_md(child, out)
+            out.append("\n")
+        elif tag in _HTML_EMPHASIS:
+            mark = _HTML_EMPHASIS[tag]
+            out.append(mark)
+            _html_node_to_md(child, out)
+            out.append(mark)
+        elif tag == "a" and child.attributes.get("href") is not None:
+            out.append("[")
+            _html_node_to_md(child, out)
+            out.append(f"]({child.attributes['href']})")
+        elif tag == "li":
+            out.append("- ")
+            _html_node_to_md(child, out)
+            out.append("\n")
+        elif tag in ("ul", "ol"):
+            out.append("\n")
+            _html_node_to_md(child, out)
+            out.append("\n")
+        elif tag == "br":
+            out.append("\n")
+        elif tag == "p":
+            _html_node_to_md(child, out)
+            out.append("\n\n")
+        elif not tag.startswith("-"):
+            # Unknown tag: keep its text (comments/doctype are skipped)
+            _html_node_to_md(child, out)
+
+
 def html_to_md(h):
     """Convert HTML to markdown."""
     if not h:
         return ""
-    h = re.sub(r'<h([1-4])[^>]*>(.*?)</h\1>',
-               lambda m: '#' * int(m.group(1)) + ' ' + m.group(2) + '\n',
-               h, flags=re.DOTALL)
-    h = re.sub(r'<strong>(.*?)</strong>', r'**\1**', h, flags=re.DOTALL)
-    h = re.sub(r'<b>(.*?)</b>', r'**\1**', h, flags=re.DOTALL)
-    h = re.sub(r'<em>(.*?)</em>', r'*\1*', h, flags=re.DOTALL)
-    h = re.sub(r'<i>(.*?)</i>', r'*\1*', h, flags=re.DOTALL)
-    h = re.sub(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', r'[\2](\1)', h, flags=re.DOTALL)
-    h = re.sub(r'<li[^>]*>(.*?)</li>', r'- \1\n', h, flags=re.DOTALL)
-    h = re.sub(r'</?[uo]l[^>]*>', '\n', h)
-    h = re.sub(r'<br\s*/?>', '\n', h)
-    h = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', h, flags=re.DOTALL)
-    h = re.sub(r'<[^>]+>', '', h)
+    if LexborHTMLParser is not None:
+        out = []
+        body = LexborHTMLParser(h).body
+        if body is not None:
+            _html_node_to_md(body, out)
+        return _RE_NL.sub('\n\n', "".join(out)).strip()
+
+    h = _RE_H.sub(_heading_to_md, h)
+    h = _RE_STRONG.sub(r'**\1**', h)
+    h = _RE_B.sub(r'**\1**', h)
+    h = _RE_EM.sub(r'*\1*', h)
+    h = _RE_I.sub(r'*\1*', h)
+    h = _RE_A.sub(r'[\2](\1)', h)
+    h = _RE_LI.sub(r'- \1\n', h)
+    # List wrappers and line breaks both become newlines
+    h = _RE_LIST_BR.sub('\n', h)
+    h = _RE_P.sub(r'\1\n\n', h)
+    h = _RE_TAG.sub('', h)
     h = html_mod.unescape(h)
-    h = re.sub(r'\n{3,}', '\n\n', h)
+    h = _RE_NL.sub('\n\n', h)
     return h.strip()
 
 
-def prosemirror_to_md(node):
-    """Convert ProseMirror JSON to markdown."""
-    if not node:
-        return ""
-    if isinstance(node, str):
-        return node
+def _pm_text_to_md(node):
+    """Render a ProseMirror text node with its marks applied."""
+    t = node.get("text", "")
+    for mark in node.get("marks", []):
+        mt = mark.get("type", "")
+        if mt == "bold":
+            t = f"**{t}**"
+        elif mt == "italic":
+            t = f"*{t}*"
+        elif mt == "link":
+            href = mark.get("attrs", {}).get("href", "")
+            t = f"[{t}]({href})"
+    return t
+
+
+def _pm_block_to_md(node, joined):
+    """Render a ProseMirror container node given its children's markdown."""
     ntype = node.get("type", "")
-    content = node.get("content", [])
-    text = node.get("text", "")
-    marks = node.get("marks", [])
-    if ntype == "text":
-        t = text
-        for mark in marks:
-            mt = mark.get("type", "")
-            if mt == "bold":
-                t = f"**{t}**"
-            elif mt == "italic":
-                t = f"*{t}*"
-            elif mt == "link":
-                href = mark.get("attrs", {}).get("href", "")
-                t = f"[{t}]({href})"
-        return t
-    parts = [prosemirror_to_md(c) for c in content]
-    joined = "".join(parts)
     if ntype == "paragraph":
         return joined + "\n\n"
     elif ntype == "heading":
@@ -166,6 +306,30 @@ def prosemirror_to_md(node):
         return joined
 
 
+def prosemirror_to_md(node):
+    """Convert ProseMirror JSON to markdown."""
+    # Iterative post-order walk (no recursion limit on deep documents).
+    # Each open container gets a parts list that its children append to.
+    parts = [[]]
+    stack = [(node, False)]
+    while stack:
+        n, children_done = stack.pop()
+        if children_done:
+            joined = "".join(parts.pop())
+            parts[-1].append(_pm_block_to_md(n, joined))
+        elif not n:
+            continue
+        elif isinstance(n, str):
+            parts[-1].append(n)
+        elif n.get("type", "") == "text":
+            parts[-1].append(_pm_text_to_md(n))
+        else:
+            stack.append((n, True))
+            parts.append([])
+            stack.extend((c, False) for c in reversed(n.get("content", [])))
+    return "".join(parts[0])
+
+
 # ── Granola Extraction Helpers ────────────────────────────────────────────
 
 def get_summary(state, doc_id):
@@ -213,73 +377,212 @@ def slugify(text, max_len=80):
 
 # ── Meeting Classification ────────────────────────────────────────────────
 
-def classify_meeting(title, participants, cfg):
-    """Classify a meeting into a subfolder based on config rules."""
+def build_classifier(cfg):
+    """Index classification rules once so classify_meeting doesn't re-walk them.
+
+    domain_rule maps each domain to the index of the first rule listing it;
+    title_keywords / name_keywords are (keyword, rule_index) pairs in rule
+    order. With pyahocorasick installed, keywords are also loaded into one
+    automaton mapping each keyword to its [(rule_index, "title" | "name")]
+    entries (skipped if any keyword is empty, which it can't represent).
+    """
+    domain_rule = {}
+    title_keywords = []
+    name_keywords = []
+    for idx, rule in enumerate(cfg.get("classification_rules", [])):
+        for domain in rule.get("domains", []):
+            domain_rule.setdefault(domain, idx)
+        title_keywords.extend((kw, idx) for kw in rule.get("title_keywords", []))
+        name_keywords.extend((kw, idx) for kw in rule.get("name_keywords", []))
+
+    automaton = None
+    all_keywords = (
+        [(kw, idx, "title") for kw, idx in title_keywords]
+        + [(kw, idx, "name") for kw, idx in name_keywords]
+    )
+    if ahocorasick is not None and all_keywords and all(kw for kw, _, _ in all_keywords):
+        hits = {}
+        for kw, idx, kind in all_keywords:
+            hits.setdefault(kw, []).append((idx, kind))
+        automaton = ahocorasick.Automaton()
+        for kw, kw_hits in hits.items():
+            automaton.add_word(kw, kw_hits)
+        automaton.make_automaton()
+
+    org_domain = cfg.get("organization_domain", "")
+    return {
+        "domain_rule": domain_rule,
+        "title_keywords": title_keywords,
+        "name_keywords": name_keywords,
+        "automaton": automaton,
+        "org_suffix": f"@{org_domain}" if org_domain else "",
+    }
+
+
+def match_rule(classifier, title_lower, names, domains):
+    """Index of the first rule matching the meeting, or None."""
+    domain_rule = classifier["domain_rule"]
+    best = min((domain_rule[d] for d in domains if d in domain_rule), default=None)
+
+    automaton = classifier["automaton"]
+    if automaton is not None:
+        # Title and names in one string; \x00 can't occur inside a keyword
+        title_end = len(title_lower)
+        for end, hits in automaton.iter(title_lower + "\x00" + "\x00".join(names)):
+            in_title = end < title_end
+            for idx, kind in hits:
+                if (kind == "title") == in_title and (best is None or idx < best):
+                    best = idx
+        return best
+
+    # Keyword lists are in rule order, so stop at the first hit or once
+    # past the best rule found so far
+    for kw, idx in classifier["title_keywords"]:
+        if best is not None and idx >= best:
+            break
+        if kw in title_lower:
+            best = idx
+            break
+    for kw, idx in classifier["name_keywords"]:
+        if best is not None and idx >= best:
+            break
+        if any(kw in n for n in names):
+            best = idx
+            break
+    return best
+
+
+def email_domains(emails):
+    """Set of domains for lowercased emails ("" for an email without "@")."""
+    return frozenset(e.split("@")[1] if "@" in e else "" for e in emails)
+
+
+def classify_meeting(title, participants, cfg, domains=None):
+    """Classify a meeting into a subfolder based on config rules.
+
+    domains may be passed in precomputed (see extract_new_meetings);
+    otherwise it is derived from the participants' emails.
+    """
     title_lower = (title or "").lower()
     emails = [p.get("email", "").lower() for p in participants]
     names = [p.get("name", "").lower() for p in participants]
-    domains = [e.split("@")[1] if "@" in e else "" for e in emails]
+    if domains is None:
+        domains = email_domains(emails)
 
-    org_domain = cfg.get("organization_domain", "")
-    classification_rules = cfg.get("classification_rules", [])
-    one_on_one_names = cfg.get("one_on_one_names", {})
-    default_folder = cfg.get("default_folder", "General")
+    classifier = cfg.get("_classifier") or build_classifier(cfg)
 
     # Check domain/keyword rules
-    for rule in classification_rules:
-        for domain in rule.get("domains", []):
-            if domain in domains:
-                return rule["folder"]
-        for kw in rule.get("title_keywords", []):
-            if kw in title_lower:
-                return rule["folder"]
-        for kw in rule.get("name_keywords", []):
-            if any(kw in n for n in names):
-                return rule["folder"]
+    idx = match_rule(classifier, title_lower, names, domains)
+    if idx is not None:
+        return cfg["classification_rules"][idx]["folder"]
 
     # Check 1:1 pattern: exactly 2 participants, both from org domain
-    if org_domain:
-        org_emails = [e for e in emails if e.endswith(f"@{org_domain}")]
-        non_org = [e for e in emails if e and not e.endswith(f"@{org_domain}")]
-        if len(non_org) == 0 and len(org_emails) == 2:
-            for name_key, folder in one_on_one_names.items():
+    org_suffix = classifier["org_suffix"]
+    if org_suffix:
+        has_non_org = any(e and not e.endswith(org_suffix) for e in emails)
+        if not has_non_org and sum(e.endswith(org_suffix) for e in emails) == 2:
+            for name_key, folder in cfg.get("one_on_one_names", {}).items():
                 if any(name_key in n for n in names):
                     return folder
             return "1:1"
 
-    return default_folder
+    return cfg.get("default_folder", "General")
 
 
 # ── Part A: Sync Meetings ─────────────────────────────────────────────────
 
+# The only parts of Granola's state that extract_new_meetings reads
+GRANOLA_STATE_KEYS = ("documents", "documentPanels", "documentLists", "documentListsMetadata", "transcripts")
+
+
 def load_granola_state(cfg):
-    """Load and parse the Granola cache."""
-    with open(cfg["_granola_cache"], "r") as f:
-        raw = json.load(f)
-    data = json.loads(raw["cache"])
-    return data["state"]
+    """Load and parse the Granola cache.
+
+    Parsing the nested JSON is the slow part of a run, and most runs find the
+    cache unchanged, so the parsed state is pickled together with the cache's
+    mtime and size. A pickle whose key matches is reused.
+    """
+    st = cfg["_granola_cache"].stat()
+    key = (st.st_mtime_ns, st.st_size)
+    pkl_path = cfg["_granola_pickle"]
+
+    try:
+        with open(pkl_path, "rb") as f:
+            cached_key, cached_state = pickle.load(f)
+        if cached_key == key:
+            return cached_state
+    except Exception:
+        pass  # missing, stale-format or corrupt pickle: fall back to parsing
+
+    with open(cfg["_granola_cache"], "rb") as f:
+        raw = _json_loads(f.read())
+    full_state = _json_loads(raw["cache"])["state"]
+
+    # Keep only what we use (and no deleted docs) so the rest can be freed
+    # right away and isn't carried into the pickle
+    state = {k: full_state[k] for k in GRANOLA_STATE_KEYS if k in full_state}
+    del raw, full_state
+    if "documents" in state:
+        state["documents"] = {
+            doc_id: doc for doc_id, doc in state["documents"].items()
+            if not doc.get("deleted_at")
+        }
+
+    try:
+        _write_atomic(pkl_path, pickle.dumps((key, state), protocol=5))
+    except OSError as e:
+        print(f"  Could not write Granola parse cache: {e}", file=sys.stderr)
+
+    return state
 
 
 def load_sync_state(cfg):
-    """Load the sync state, creating default if missing."""
+    """Load the sync state, creating default if missing.
+
+    A newer last_sync from the sidecar written by save_last_sync overrides the
+    one in the main file. The sidecar is ignored when the main file is gone,
+    so deleting sync-state.json still forces a full re-sync.
+    """
     path = cfg["_sync_state"]
     if path.exists():
-        with open(path) as f:
-            state = json.load(f)
+        with open(path, "rb") as f:
+            state = _json_loads(f.read())
         if "synced_ids" in state and "meetings" not in state:
             state = {"last_sync": state.get("last_sync"), "meetings": {}}
             for sid in state.get("synced_ids", []):
                 state["meetings"][sid] = {"skipped": True}
+        try:
+            with open(path.with_suffix(".lastsync"), "rb") as f:
+                sidecar = _json_loads(f.read()).get("last_sync")
+        except (OSError, ValueError):
+            sidecar = None
+        if sidecar and (not state.get("last_sync") or sidecar > state["last_sync"]):
+            state["last_sync"] = sidecar
         return state
     return {"last_sync": None, "meetings": {}}
 
 
+def save_last_sync(cfg, last_sync):
+    """Record only last_sync, in a small sidecar next to the sync state.
+
+    Used when a run synced nothing, to avoid rewriting the full state file.
+    """
+    path = cfg["_sync_state"].with_suffix(".lastsync")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_json_dumps({"last_sync": last_sync}))
+
+
 def save_sync_state(cfg, state):
     """Save sync state to disk."""
     path = cfg["_sync_state"]
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(state, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(_json_dumps(state, indent=True))
+
+
+# Transcript speaker labels by Granola audio source
+_SOURCE_LABELS = {"microphone": "me", "system": "them"}
 
 
 def extract_new_meetings(granola_state, sync_state):
@@ -299,8 +602,9 @@ def extract_new_meetings(granola_state, sync_state):
 
     # Build folder lookup
     folder_lookup = {}
+    lists_meta = granola_state.get("documentListsMetadata", {})
     for list_id, list_data in granola_state.get("documentLists", {}).items():
-        meta = granola_state.get("documentListsMetadata", {}).get(list_id, {})
+        meta = lists_meta.get(list_id, {})
         folder_name = meta.get("title", "Unknown")
         if isinstance(list_data, list):
             for item in list_data:
@@ -308,15 +612,16 @@ def extract_new_meetings(granola_state, sync_state):
                 if doc_id:
                     folder_lookup[doc_id] = folder_name
 
+    transcripts = granola_state.get("transcripts", {})
     new_meetings = []
     for doc_id, doc in granola_state.get("documents", {}).items():
-        if doc.get("deleted_at") or doc.get("valid_meeting") is False:
-            continue
+        # Cheapest filters first: most docs are already known or too old
         if doc_id in known_ids:
             continue
         created = doc.get("created_at", "")
-        is_today = created.startswith(today_prefix)
-        if not is_today and created < cutoff:
+        if created < cutoff and not created.startswith(today_prefix):
+            continue
+        if doc.get("deleted_at") or doc.get("valid_meeting") is False:
             continue
 
         # Build participants
@@ -326,34 +631,36 @@ def extract_new_meetings(granola_state, sync_state):
         cal = doc.get("google_calendar_event") or {}
         cal_attendees = cal.get("attendees", [])
 
-        participants = []
-        seen_emails = set()
+        # Keyed by lowercased email; first source wins (creator, people, calendar)
+        parts = {}
 
         if creator.get("email"):
             name = creator.get("name", "")
             details = creator.get("details", {})
             full_name = details.get("person", {}).get("name", {}).get("fullName", name)
-            participants.append({"name": full_name, "email": creator["email"]})
-            seen_emails.add(creator["email"].lower())
+            parts[creator["email"].lower()] = {"name": full_name, "email": creator["email"]}
 
         for a in people_attendees:
             email = a.get("email", "")
+            if not email:
+                continue
             name = a.get("name", "")
             if not name:
                 details = a.get("details", {})
                 name = details.get("person", {}).get("name", {}).get("fullName", "")
-            if email and email.lower() not in seen_emails:
-                participants.append({"name": name, "email": email})
-                seen_emails.add(email.lower())
+            parts.setdefault(email.lower(), {"name": name, "email": email})
 
         for a in cal_attendees:
             email = a.get("email", "")
-            if email and email.lower() not in seen_emails:
-                participants.append({"name": a.get("displayName", ""), "email": email})
-                seen_emails.add(email.lower())
+            if email:
+                parts.setdefault(email.lower(), {"name": a.get("displayName", ""), "email": email})
+
+        participants = list(parts.values())
+        # parts is keyed by lowercased email, so the domains come for free
+        domains = email_domains(parts)
 
         # Transcript
-        transcript_segments = granola_state.get("transcripts", {}).get(doc_id, [])
+        transcript_segments = transcripts.get(doc_id, [])
         transcript_lines = []
         if isinstance(transcript_segments, list) and transcript_segments:
             for seg in transcript_segments:
@@ -362,7 +669,7 @@ def extract_new_meetings(granola_state, sync_state):
                     continue
                 ts = seg.get("start_timestamp", "")[:19].replace("T", " ")
                 source = seg.get("source", "unknown")
-                label = "me" if source == "microphone" else "them" if source == "system" else source
+                label = _SOURCE_LABELS.get(source, source)
                 transcript_lines.append(f"[{ts}] ({label}) {text}")
 
         new_meetings.append({
@@ -371,6 +678,7 @@ def extract_new_meetings(granola_state, sync_state):
             "created_at": created,
             "granola_folder": folder_lookup.get(doc_id, ""),
             "participants": participants,
+            "domains": domains,
             "notes": get_notes(doc),
             "summary": get_summary(granola_state, doc_id),
             "transcript": "\n".join(transcript_lines),
@@ -380,23 +688,29 @@ def extract_new_meetings(granola_state, sync_state):
     return new_meetings
 
 
-def write_meeting_file(meeting, cfg):
-    """Write a meeting markdown file to the appropriate folder. Returns the relative path."""
+# Escapes double quotes inside quoted YAML frontmatter values
+_YAML_QUOTE_ESCAPE = str.maketrans({'"': '\\"'})
+
+
+def render_meeting_file(meeting, cfg):
+    """Classify a meeting and build its markdown. Returns (relative path, content).
+
+    Creates the destination folder but doesn't write the file.
+    """
     meetings_dir = cfg["_meetings_dir"]
     created_date = meeting["created_at"][:10]
     title_slug = slugify(meeting["title"])
     filename = f"{created_date}-{title_slug}.md"
 
-    folder = classify_meeting(meeting["title"], meeting["participants"], cfg)
+    folder = classify_meeting(meeting["title"], meeting["participants"], cfg, meeting.get("domains"))
     dest_dir = meetings_dir / folder
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     # Build participants YAML
-    participants_yaml = ""
-    for p in meeting["participants"]:
-        name = p.get("name", "").replace('"', '\\"')
-        email = p.get("email", "")
-        participants_yaml += f'  - name: "{name}"\n    email: {email}\n'
+    participants_yaml = "".join(
+        f'  - name: "{p.get("name", "").translate(_YAML_QUOTE_ESCAPE)}"\n    email: {p.get("email", "")}\n'
+        for p in meeting["participants"]
+    )
 
     summary = meeting["summary"] or "No summary available."
     notes = meeting["notes"] or "No notes."
@@ -425,10 +739,25 @@ participants:
 
 {transcript}
 """
-    dest_path = dest_dir / filename
-    dest_path.write_text(content)
+    return f"{folder}/{filename}", content
+
+
+def write_file(path, content):
+    """Write text as UTF-8 with a bare open/write/close (no text I/O layer)."""
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
 
-    return f"{folder}/{filename}"
+def write_meeting_file(meeting, cfg):
+    """Write a meeting markdown file to the appropriate folder. Returns the relative path."""
+    rel_path, content = render_meeting_file(meeting, cfg)
+    write_file(cfg["_meetings_dir"] / rel_path, content)
+    return rel_path
 
 
 def sync_meetings(cfg):
@@ -441,10 +770,11 @@ def sync_meetings(cfg):
 
     if not new_meetings:
         print("  No new meetings to sync.")
-        save_sync_state(cfg, {
-            "last_sync": datetime.now(timezone.utc).isoformat(),
-            "meetings": sync_state.get("meetings", {}),
-        })
+        now = datetime.now(timezone.utc).isoformat()
+        if cfg["_sync_state"].exists():
+            save_last_sync(cfg, now)
+        else:
+            save_sync_state(cfg, {"last_sync": now, "meetings": sync_state.get("meetings", {})})
         return []
 
     print(f"  Found {len(new_meetings)} new meeting(s).")
@@ -454,8 +784,15 @@ def sync_meetings(cfg):
     meetings_dict = sync_state.get("meetings", {})
     meetings_dir = cfg["_meetings_dir"]
 
-    for meeting in new_meetings:
-        rel_path = write_meeting_file(meeting, cfg)
+    # Classify and render serially, then overlap the file writes. Keyed by
+    # path so that, as with sequential writes, the last meeting to claim a
+    # filename wins.
+    rendered = [render_meeting_file(meeting, cfg) for meeting in new_meetings]
+    writes = {meetings_dir / rel_path: content for rel_path, content in rendered}
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(write_file, writes.keys(), writes.values()))
+
+    for meeting, (rel_path, _) in zip(new_meetings, rendered):
         if meeting["created_at"][:10] == today:
             today_files.append(meetings_dir / rel_path)
 
@@ -483,78 +820,148 @@ def sync_meetings(cfg):
 
 # ── Part B: Extract Action Items ──────────────────────────────────────────
 
-def extract_action_items_from_file(file_path):
-    """Parse a meeting file and extract action items from the Transcript section."""
-    content = file_path.read_text()
+def is_action_line(text):
+    """True if text matches an action pattern and no noise pattern."""
+    is_action = False
+    for m in ACTION_OR_NOISE_RE.finditer(text):
+        if m.lastgroup == "noise":
+            return False
+        is_action = True
+    return is_action
+
+
+def load_action_items_cache(cfg):
+    """Load per-file extraction results: {path: [mtime_ns, size, title, items]}."""
+    try:
+        with open(cfg["_action_items_cache"], "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_action_items_cache(cfg, cache):
+    """Save the extraction cache, keeping only entries for today's files.
+
+    Lookups only ever happen for today's files (see find_todays_meetings), so
+    older entries would never be hit again.
+    """
+    prefix = datetime.now().strftime("%Y-%m-%d") + "-"
+    cache = {p: entry for p, entry in cache.items()
+             if os.path.basename(p).startswith(prefix)}
+    try:
+        _write_atomic(cfg["_action_items_cache"], _json_dumps(cache))
+    except OSError as e:
+        print(f"  Could not write action-item cache: {e}", file=sys.stderr)
+
+
+def extract_action_items_from_file(file_path, cache=None):
+    """Parse a meeting file and extract action items from the Transcript section.
+
+    With a cache (see load_action_items_cache), files whose mtime and size
+    are unchanged since the last scan return the stored result instead.
+    """
+    if cache is None:
+        return _scan_action_items(file_path)
 
-    title_match = re.search(r'^title:\s*"?([^"\n]+)"?', content, re.MULTILINE)
-    title = title_match.group(1).strip() if title_match else file_path.stem
+    st = file_path.stat()
+    entry = cache.get(str(file_path))
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2], entry[3]
 
-    # Extract transcript section
-    transcript_match = re.search(r'## Transcript\n+(.*?)(?=\n## |\Z)', content, re.DOTALL)
-    if not transcript_match:
+    title, action_items = _scan_action_items(file_path)
+    cache[str(file_path)] = [st.st_mtime_ns, st.st_size, title, action_items]
+    return title, action_items
+
+
+def _scan_action_items(file_path):
+    """Uncached body of extract_action_items_from_file."""
+    # Stream the file: only the title line and the transcript section are
+    # needed, so the summary and notes are never held in memory
+    title = None
+    transcript_parts = None
+    with open(file_path, encoding="utf-8") as f:
+        for line in f:
+            if transcript_parts is not None:
+                if line.startswith("## "):
+                    break
+                transcript_parts.append(line)
+            elif line == "## Transcript\n":
+                transcript_parts = []
+            elif title is None and line.startswith("title:"):
+                title = TITLE_LINE_RE.match(line).group(1).strip()
+
+    if title is None:
+        title = file_path.stem
+    if transcript_parts is None:
         return title, []
 
-    transcript_text = transcript_match.group(1).strip()
+    transcript_text = "".join(transcript_parts).strip()
     if transcript_text.startswith("Transcript not available"):
         return title, []
 
     # Parse transcript lines: [timestamp] (speaker) text
-    lines = []
-    for m in re.finditer(
-        r'^\[([^\]]+)\]\s*\((\w+)\)\s*(.+)$', transcript_text, re.MULTILINE
-    ):
-        lines.append({"ts": m.group(1), "speaker": m.group(2), "text": m.group(3).strip()})
+    speakers = []
+    texts = []
+    for m in TRANSCRIPT_LINE_RE.finditer(transcript_text):
+        speakers.append(m.group("speaker"))
+        texts.append(m.group("text").strip())
 
-    if not lines:
+    if not texts:
         return title, []
 
-    # Scan for action-item patterns, grabbing context around matches
+    return title, scan_transcript_lines(texts, speakers)
+
+
+def scan_transcript_lines(texts, speakers):
+    """Find action items in parallel lists of transcript texts and speakers.
+
+    Each hit is the matching line plus up to 2 following non-filler lines for
+    context, tagged with the speaker: "(speaker) text".
+    """
+    # Match filler once per line; each line is also checked as context
+    filler_match = FILLER_PATTERNS.match
+    is_filler = [filler_match(text) is not None for text in texts]
+    n = len(texts)
+
     action_items = []
     seen = set()
 
-    for idx, line in enumerate(lines):
-        text = line["text"]
-
-        # Skip filler
-        if FILLER_PATTERNS.match(text):
+    for idx in range(n):
+        if is_filler[idx]:
             continue
 
-        if TRANSCRIPT_ACTION_RE.search(text) and not NOISE_PATTERNS.search(text):
+        text = texts[idx]
+        if is_action_line(text):
             # Grab this line + up to 2 following lines for context
             parts = [text]
-            for j in range(1, 3):
-                if idx + j < len(lines):
-                    next_text = lines[idx + j]["text"]
-                    if not FILLER_PATTERNS.match(next_text):
-                        parts.append(next_text)
-                    else:
-                        break
+            for k in range(idx + 1, min(idx + 3, n)):
+                if is_filler[k]:
+                    break
+                parts.append(texts[k])
 
             combined = " ".join(parts)
             # Clean up and truncate
-            combined = re.sub(r'\s+', ' ', combined).strip()
+            combined = WHITESPACE_RE.sub(' ', combined).strip()
             if len(combined) > 200:
                 combined = combined[:200] + "..."
 
-            # Deduplicate similar items
-            dedup_key = combined[:60].lower()
+            # Deduplicate similar items (int keys; hash() is stable within a run)
+            dedup_key = hash(combined[:60].lower())
             if dedup_key not in seen and len(combined) > 10:
                 seen.add(dedup_key)
                 # Tag with speaker
-                speaker = line["speaker"]
-                action_items.append(f"({speaker}) {combined}")
+                action_items.append(f"({speakers[idx]}) {combined}")
 
-    return title, action_items
+    return action_items
 
 
-def get_todays_action_items(today_files):
+def get_todays_action_items(today_files, cache=None):
     """Extract action items from all of today's meeting files."""
     results = []
     for file_path in today_files:
         if not file_path.exists():
             continue
-        title, items = extract_action_items_from_file(file_path)
+        title, items = extract_action_items_from_file(file_path, cache)
         if items:
             results.append({"title": title, "items": items})
     return results
@@ -562,15 +969,30 @@ def get_todays_action_items(today_files):
 
 def find_todays_meetings(cfg):
     """Find all meeting files created today (fallback if sync returns empty)."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    return list(cfg["_meetings_dir"].rglob(f"{today}-*.md"))
+    prefix = datetime.now().strftime("%Y-%m-%d") + "-"
+    found = []
+    # Walk with scandir: DirEntry caches the file type, so no per-file stat
+    # or glob matching. Folders can nest (e.g. "1:1/Alice"), so recurse.
+    pending = [cfg["_meetings_dir"]]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue  # missing or unreadable folder: skip it, as rglob did
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.startswith(prefix) and entry.name.endswith(".md"):
+                    found.append(Path(entry.path))
+    return found
 
 
 # ── Part C: Post to Slack ─────────────────────────────────────────────────
 
 def build_slack_blocks(action_items_by_meeting):
     """Build Slack Block Kit blocks for action items."""
-    blocks = [
+    return [
         {
             "type": "header",
             "text": {
@@ -579,21 +1001,60 @@ def build_slack_blocks(action_items_by_meeting):
             },
         },
         {"type": "divider"},
+        # Title, bulleted items and a divider per meeting
+        *itertools.chain.from_iterable(
+            (
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": f"*{meeting['title']}*"},
+                },
+                {
+                    "type": "section",
+                    "text": {
+                        "type": "mrkdwn",
+                        "text": "\n".join(f"\u2022 {item}" for item in meeting["items"]),
+                    },
+                },
+                {"type": "divider"},
+            )
+            for meeting in action_items_by_meeting
+        ),
     ]
 
-    for meeting in action_items_by_meeting:
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": f"*{meeting['title']}*"},
-        })
-        items_text = "\n".join(f"\u2022 {item}" for item in meeting["items"])
-        blocks.append({
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": items_text},
-        })
-        blocks.append({"type": "divider"})
 
-    return blocks
+# Reused across Slack API calls so only the first one pays for the TLS handshake
+_slack_conn = None
+
+
+def slack_api_post(path, token, data):
+    """POST a JSON body to the Slack Web API and return the parsed response.
+
+    Retries once on a fresh connection if the kept-alive one was closed by
+    the server. Raises OSError / http.client.HTTPException on failure.
+    """
+    global _slack_conn
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "Authorization": f"Bearer {token}",
+    }
+    for attempt in range(2):
+        if _slack_conn is None:
+            _slack_conn = http.client.HTTPSConnection("slack.com", timeout=10)
+        try:
+            _slack_conn.request("POST", path, body=data, headers=headers)
+            resp = _slack_conn.getresponse()
+            body = resp.read()
+        except (OSError, http.client.HTTPException) as e:
+            # Don't leave a half-used connection behind for the next call
+            _slack_conn.close()
+            _slack_conn = None
+            stale = isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError))
+            if stale and not attempt:
+                continue
+            raise
+        if resp.status != 200:
+            raise http.client.HTTPException(f"HTTP {resp.status} {resp.reason}")
+        return _json_loads(body)
 
 
 def post_to_slack(action_items_by_meeting, cfg):
@@ -621,28 +1082,17 @@ def post_to_slack(action_items_by_meeting, cfg):
             "blocks": blocks,
         }
 
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        "https://slack.com/api/chat.postMessage",
-        data=data,
-        headers={
-            "Content-Type": "application/json; charset=utf-8",
-            "Authorization": f"Bearer {token}",
-        },
-    )
-
     try:
-        with urllib.request.urlopen(req) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-            if result.get("ok"):
-                print(f"  Slack message posted to #{channel}")
-            else:
-                print(f"  Slack API error: {result.get('error', 'unknown')}", file=sys.stderr)
-                return False
-    except urllib.error.URLError as e:
+        result = slack_api_post("/api/chat.postMessage", token, _json_dumps(payload))
+    except (OSError, http.client.HTTPException) as e:
         print(f"  Failed to post to Slack: {e}", file=sys.stderr)
         return False
 
+    if not result.get("ok"):
+        print(f"  Slack API error: {result.get('error', 'unknown')}", file=sys.stderr)
+        return False
+
+    print(f"  Slack message posted to #{channel}")
     return True
 
 
@@ -668,7 +1118,9 @@ def main():
     print(f"\n  Today's meeting files: {len(today_files)}")
 
     # Part B: Extract action items
-    action_items = get_todays_action_items(today_files)
+    action_items_cache = load_action_items_cache(cfg)
+    action_items = get_todays_action_items(today_files, action_items_cache)
+    save_action_items_cache(cfg, action_items_cache)
     total_items = sum(len(m["items"]) for m in action_items)
     print(f"  Action items found: {total_items} across {len(action_items)} meeting(s)")
 